@@ -5,14 +5,28 @@ year:   2023
 """
 
 
+import csv
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from os.path import exists
-from win32com.client import Dispatch
+from os.path import join
+from tempfile import TemporaryDirectory
+from traceback import clear_frames
+from threading import Lock
+from threading import local
+import pythoncom
+from pywintypes import com_error
+from win32com.client import gencache
 from typing import Generator
 from typing import Any
+from typing import Callable
+from warnings import warn
 from errors import NotFoundExcelFileError
 from errors import NotFoundSheetError
 
-__version__ = "1.0"
+__version__ = "2.0"
 __all__ = ["ExcelHandler"]
 
 class ExcelHandler:
@@ -27,25 +41,169 @@ class ExcelHandler:
         set_sheet
         get_columns_count
         get_rows_count
+        used_range_tuple
         fetch_all
         fetch_range
+        fetch_all_numpy
+        fetch_all_records
+        apply
+        fetch_range_packed
         get_as_dict
+        fetch_all_as_dicts
+        get_as_namedtuple
+        export_csv
+        fetch_all_csv
+        fetch_all_openpyxl
         update_cell
+        update_range
+        fast_mode
+        cached_bounds
         save
         save_as
         close
+        quit_app
+        run_parallel
     
     @note
         better to use this class as context manager.
     """
-    EMPTY_ROWS_TOLERANCE = 5
+    XL_BY_ROWS = 1
+    XL_BY_COLUMNS = 2
+    XL_PREVIOUS = 2
+    XL_VALUES = -4163
+    XL_CALCULATION_MANUAL = -4135
+    XL_NO_KEY = 0
+    XL_CSV_UTF8 = 62
+    CHUNK_SIZE = 5000
+    DICT_LITERAL_MAX_HEADERS = 24
+    INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+    _apps = local()
+    _apps_lock = Lock()
+    _wrapper_generated = False
+
     def __init__(self,
-                 dev: bool = False) -> None:
-        self.excel_app = Dispatch("Excel.Application")
-        self.rows_count = 0
+                 dev: bool = False,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        -> Params
+            dev: bool → show the Excel window
+            chunk_size: int → rows per COM call in fetch_range
+        @note
+            All the handlers of a thread share one Excel
+            application, so dev=True makes it visible
+            for every handler of the thread.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        self.excel_app = type(self)._get_app()
+        self.work_book = None
+        self.chunk_size = chunk_size
+        self._rows_count = None
+        self._columns_count = None
+        self._cache_bounds = False
         if dev:
             self.excel_app.Visible = 1
 
+    @classmethod
+    def _get_app(cls) -> object:
+        """
+        Returns the Excel application shared by all
+        the handlers of the current thread and starts
+        it on first use.
+        ---------------------------------------------
+        @note
+            COM objects belong to the thread which
+            created them, so every thread gets its
+            own application. Only the first start,
+            which generates the gencache wrapper, is
+            serialised; later ones run in parallel.
+        """
+        app = getattr(cls._apps, "app", None)
+        if app is not None:
+            return app
+        with cls._apps_lock:
+            if not cls._wrapper_generated:
+                app = gencache.EnsureDispatch("Excel.Application")
+                cls._wrapper_generated = True
+        if app is None:
+            app = gencache.EnsureDispatch("Excel.Application")
+        cls._apps.app = app
+        return app
+
+    @classmethod
+    def quit_app(cls) -> None:
+        """
+        Quit the shared Excel application of the
+        current thread. The next handler starts a
+        new one.
+        ----------------------------------------
+        @note
+            Every live handler of the thread still
+            points to the closed application, and its
+            next call raises com_error. Only call it
+            once all the handlers of the thread are
+            closed.
+        """
+        app = getattr(cls._apps, "app", None)
+        if app is not None:
+            app.Quit()
+            cls._apps.app = None
+
+    @classmethod
+    def run_parallel(cls,
+                     file_paths: tuple,
+                     work_fn: Callable,
+                     max_workers: int = 4) -> list:
+        """
+        Open every file in its own handler on a pool
+        of threads and call work_fn(handler) on it, so
+        the opening and reading of the files overlap.
+        ----------------------------------------------
+        -> Params
+            file_paths: tuple
+            work_fn: Callable → work_fn(handler)
+            max_workers: int
+        <- Return
+            list of the work_fn results in the order
+            of the file paths
+        @note
+            Every file runs in a separate Excel process,
+            which costs memory. The files are opened read
+            only and closed without saving. work_fn must
+            return plain data, not generators or COM
+            objects, because the work book is closed and
+            Excel quits once it returns. Handlers of other
+            threads must not be used inside work_fn.
+        """
+        def run(file_path: str) -> Any:
+            handler = cls()
+            try:
+                handler.open_excel(file_path, read_only=True)
+                return work_fn(handler)
+            finally:
+                handler.close(save_changes=False)
+                handler.sheet = None
+                handler.excel_app = None
+
+        def work(file_path: str) -> Any:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+            try:
+                try:
+                    return run(file_path)
+                except BaseException as error:
+                    # The traceback keeps the frames of run and
+                    # work_fn alive, drop their COM objects before
+                    # COM is uninitialised on this thread.
+                    clear_frames(error.__traceback__)
+                    raise
+                finally:
+                    cls.quit_app()
+            finally:
+                pythoncom.CoUninitialize()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(work, file_paths))
+
     def __enter__(self)-> object:
         return self
     
@@ -54,23 +212,38 @@ class ExcelHandler:
     
     def open_excel(self, 
                    file_path: str,
-                   sheet_name: str = None) -> None:
+                   sheet_name: str = None,
+                   read_only: bool = False) -> None:
         """
         Open an excel file if the path provided
         or create new one of file path is empty.
+        ----------------------------------------
+        -> Params
+            file_path: str
+            sheet_name: str
+            read_only: bool
+        @note
+            Links to other files are never updated
+            while opening. read_only also skips the
+            read-only recommendation prompt, which is
+            much faster for files that are only going
+            to be read.
         """
-        if not exists(file_path):
-            raise NotFoundExcelFileError("Couldn't find the desired excel file.")
-        self.excel_app.Workbooks.open(file_path)
-        self.work_book = self.excel_app.WorkBooks(1)
+        try:
+            self.work_book = self.excel_app.Workbooks.Open(
+                file_path,
+                UpdateLinks=0,
+                ReadOnly=read_only,
+                IgnoreReadOnlyRecommended=read_only)
+        except com_error as error:
+            raise NotFoundExcelFileError("Couldn't open the desired excel file.") from error
         self.set_sheet(sheet_name)
 
     def create_new(self)-> None:
         """
         Create new excel file
         """
-        self.excel_app.Workbooks.Add()
-        self.work_book = self.excel_app.WorkBooks(1)
+        self.work_book = self.excel_app.Workbooks.Add()
         self.set_sheet()
 
     def set_sheet(self, sheet_name: str = None) -> None:
@@ -80,99 +253,104 @@ class ExcelHandler:
         -> Params
             sheet_name: str
         """
+        self._invalidate_bounds()
         if not sheet_name:
             self.sheet = self.work_book.Sheets(1)
             return
-        total_sheets_count = self.work_book.Sheets.Count
-        for sheet_number in range(1, total_sheets_count + 1):
-            self.sheet = self.work_book.Sheets(sheet_number)
-            if self.sheet.name == sheet_name:
-                break
-        raise NotFoundSheetError("Desired sheet is not in the file.")
+        try:
+            self.sheet = self.work_book.Sheets(sheet_name)
+        except com_error as error:
+            raise NotFoundSheetError("Desired sheet is not in the file.") from error
 
     def get_columns_count(self) -> int:
         """
-        Loop through the first row and count
-        the number of columns until it faces
-        empty column and stops. Then return
-        the counter as number of columns.
-        so line order null
-        """
-        column_count = 0
-        while True:
-            if self.sheet.Cells(1, column_count + 1).value:
-                column_count += 1
-                continue
-            break
-        return column_count
-    
-    def _calculate_rows_count(self,
-                             columns_count: int,
-                             rows_count: int = 1,
-                             stride: int = 1000) -> None:
-        """
-        Recursive method to find the last row in
-        the file.
-        ----------------------------------------
-        -> Params
-            columns_count: int
-            rows_count: int
-            stride: int
+        Returns the number of columns, which is the
+        last column holding a value anywhere in the
+        sheet. Returns 0 if the sheet is empty.
         """
-        if stride == 0:
-            self.rows_count = rows_count - 1
-            return
-        row_data = self.sheet.Range(
-                            self.sheet.Cells(rows_count, 1),
-                            self.sheet.Cells(rows_count, columns_count))
-        row_data = row_data.value[0]
-        if any(row_data):
-            rows_count += stride       
-        else:
-            stride //= 2
-            rows_count -= stride
-        self._calculate_rows_count(columns_count, rows_count, stride)
+        if self._columns_count is not None:
+            return self._columns_count
+        cell = self._find_last_cell(self.XL_BY_COLUMNS)
+        columns_count = 0 if cell is None else cell.Column
+        if self._cache_bounds:
+            self._columns_count = columns_count
+        return columns_count
 
-    def check_empty_rows(self, columns_count: int) -> int:
+    def get_rows_count(self) -> int:
         """
-        In some of files, there are spaces between
-        rows. This method checks them whether is 
-        there any row after the last calculated
-        row or not. If yes then tries to find the
-        last rows and returns the new number of rows
-        count.
-        --------------------------------------------
-        -> Params
-            columns_count: int
+        Returns the number of rows, which is the
+        last row holding a value anywhere in the
+        sheet. Returns 0 if the sheet is empty.
         """
-        empty_rows_faced_coount = 1
-        rows_count = self.rows_count + 1
-        while empty_rows_faced_coount < self.EMPTY_ROWS_TOLERANCE:
-            rows_count += 1
-            row_data = self.sheet.Range(
-                            self.sheet.Cells(rows_count, 1),
-                            self.sheet.Cells(rows_count, columns_count))
-            row_data = row_data.value[0]
-            if any(row_data):
-                empty_rows_faced_coount = 0
-                continue
-            empty_rows_faced_coount += 1
-        rows_count -= self.EMPTY_ROWS_TOLERANCE
+        if self._rows_count is not None:
+            return self._rows_count
+        cell = self._find_last_cell(self.XL_BY_ROWS)
+        rows_count = 0 if cell is None else cell.Row
+        if self._cache_bounds:
+            self._rows_count = rows_count
         return rows_count
-    
+
     def calculate_rows_count(self, columns_count: int) -> int:
         """
         Returns the number of valid rows(end of the file)
         count.
         -------------------------------------------------
         -> Params
-            columns_count: int
+            columns_count: int → not used anymore
         <- Return
             rows_count: int
+        @note
+            Deprecated, use get_rows_count instead.
         """
-        self._calculate_rows_count(columns_count)
-        rows_count = self.check_empty_rows(columns_count)
-        return rows_count
+        warn("calculate_rows_count is deprecated, use get_rows_count instead.",
+             DeprecationWarning,
+             stacklevel=2)
+        return self.get_rows_count()
+
+    def _find_last_cell(self, search_order: int) -> object:
+        """
+        Search the sheet backward for any value with
+        one Range.Find call. Unlike UsedRange it is
+        not fooled by formatted empty cells, and unlike
+        End it doesn't depend on the first row/column.
+        ------------------------------------------------
+        -> Params
+            search_order: int → XL_BY_ROWS, XL_BY_COLUMNS
+        <- Return
+            the last cell or None for an empty sheet
+        """
+        return self.sheet.Cells.Find("*",
+                                     LookIn=self.XL_VALUES,
+                                     SearchOrder=search_order,
+                                     SearchDirection=self.XL_PREVIOUS)
+
+    def _invalidate_bounds(self) -> None:
+        """
+        Forget the cached rows and columns count.
+        """
+        self._rows_count = None
+        self._columns_count = None
+
+    @contextmanager
+    def cached_bounds(self) -> Generator:
+        """
+        Remember the rows and columns count for the
+        duration of the block instead of asking Excel
+        on every call. Writes through this handler
+        and changing the sheet still reset them.
+        ------------------------------------------------
+        @note
+            Only use it when nothing else edits the
+            sheet inside the block.
+        """
+        cache_bounds = self._cache_bounds
+        self._cache_bounds = True
+        try:
+            yield self
+        finally:
+            self._cache_bounds = cache_bounds
+            if not cache_bounds:
+                self._invalidate_bounds()
 
     def fetch_all(self, 
                   rows_count: int = None,
@@ -186,19 +364,98 @@ class ExcelHandler:
         <- Return
             Generator
         @note
-            As the end of the sheet is not specified
-            and we have to find it by ourselve, user
-            can specify the end last row and column
-            to ignore the steps finding the last row
-            and column.
+            Without rows_count and columns_count the used
+            range of the sheet is read with one COM call.
+            For very large sheets pass them to read from
+            (1, 1) in chunks with fetch_range instead.
+            Either way the rows start at the cell (1, 1),
+            so the n-th row is the n-th row of the sheet.
         """
-        self.rows_count = rows_count
         if not all((rows_count, columns_count)):
-            columns_count = self.get_columns_count()
-            rows_count = self.calculate_rows_count(columns_count)
+            yield from self._pad_to_origin(*self.used_range_tuple())
+            return
         yield from self.fetch_range((1, 1), 
                                     (rows_count, columns_count))
 
+    @staticmethod
+    def _pad_to_origin(first_row: int,
+                       first_column: int,
+                       rows_count: int,
+                       columns_count: int,
+                       values: tuple) -> Generator:
+        """
+        Yield the values of a block starting at
+        (first_row, first_column) as if it was read
+        from (1, 1), padding the sheet with None.
+        -------------------------------------------
+        -> Params
+            the result of used_range_tuple
+        """
+        if not values:
+            return
+        padding = (None,) * (first_column - 1)
+        empty_row = padding + (None,) * columns_count
+        for _ in range(first_row - 1):
+            yield empty_row
+        if not padding:
+            yield from values
+            return
+        for row in values:
+            yield padding + row
+
+    def used_range_tuple(self) -> tuple:
+        """
+        Read the used range of the sheet, its position
+        and its data at once. Leading and trailing empty
+        rows and columns, which Excel keeps in the used
+        range for formatted or cleared cells, are dropped
+        and the position is moved past them.
+        ----------------------------------------------
+        <- Return
+            (first_row, first_column,
+             rows_count, columns_count, values)
+        """
+        used_range = self.sheet.UsedRange
+        values = used_range.Value
+        if not isinstance(values, tuple):
+            values = ((values,),)
+        skipped_rows, skipped_columns, values = self._trim_empty(values)
+        rows_count = len(values)
+        columns_count = len(values[0]) if values else 0
+        return (used_range.Row + skipped_rows,
+                used_range.Column + skipped_columns,
+                rows_count, columns_count, values)
+
+    @staticmethod
+    def _trim_empty(values: tuple) -> tuple:
+        """
+        Drop the leading and trailing rows and columns
+        whose cells are all empty.
+        ----------------------------------------------
+        -> Params
+            values: tuple → ((None, None), (None, 1))
+        <- Return
+            (skipped_rows, skipped_columns, values)
+        """
+        first_row = 0
+        end_row = len(values)
+        while first_row < end_row and all(cell is None for cell in values[first_row]):
+            first_row += 1
+        while end_row > first_row and all(cell is None for cell in values[end_row - 1]):
+            end_row -= 1
+        values = values[first_row:end_row]
+        if not values:
+            return (0, 0, ())
+        first_column = 0
+        end_column = len(values[0])
+        while first_column < end_column and all(row[first_column] is None for row in values):
+            first_column += 1
+        while end_column > first_column and all(row[end_column - 1] is None for row in values):
+            end_column -= 1
+        if (first_column, end_column) != (0, len(values[0])):
+            values = tuple(row[first_column:end_column] for row in values)
+        return (first_row, first_column, values)
+
     def fetch_range(self, start: tuple, end: tuple) -> Generator:
         """
         Fetch data from sepcific positions range
@@ -207,10 +464,147 @@ class ExcelHandler:
         -> Params
             start: tuple → (1, 1)
             end: tuple → (14556, 3)
+        @note
+            The range is read in blocks of chunk_size
+            rows, one COM call per block, so the first
+            rows are available before the whole range
+            is read and memory stays bounded.
+            A single cell block comes back as a bare
+            value, so it is wrapped as one row.
         """
-        range_object = self.sheet.Range(self.sheet.Cells(*start),
-                                        self.sheet.Cells(*end))
-        yield from range_object.value
+        cells = self.sheet.Cells
+        range_ = self.sheet.Range
+        start_row, start_column = start
+        end_row, end_column = end
+        for chunk_start in range(start_row, end_row + 1, self.chunk_size):
+            chunk_end = min(chunk_start + self.chunk_size - 1, end_row)
+            range_object = range_(cells(chunk_start, start_column),
+                                  cells(chunk_end, end_column))
+            values = range_object.Value
+            if not isinstance(values, tuple):
+                values = ((values,),)
+            yield from values
+
+    def fetch_range_packed(self,
+                           start: tuple,
+                           end: tuple,
+                           typecode: str = "d") -> Generator:
+        """
+        Fetch data from sepcific positions range as
+        packed arrays, the typecode's item size per
+        cell (8 bytes for "d" and "q") instead of a
+        python object per cell.
+        ------------------------------------------
+        -> Params
+            start: tuple → (1, 1)
+            end: tuple → (14556, 3)
+            typecode: str → "d" for float64, "q" for int64
+        @note
+            Only for ranges which hold numbers in every
+            cell; empty or text cells raise TypeError.
+            Excel returns every number as a float, so
+            for integer typecodes every cell must be a
+            whole number, otherwise ValueError is raised.
+            numpy.frombuffer reads the rows without
+            copying them.
+        """
+        if typecode in self.INTEGER_TYPECODES:
+            whole_number = self._whole_number
+            for row in self.fetch_range(start, end):
+                yield array(typecode, map(whole_number, row))
+            return
+        for row in self.fetch_range(start, end):
+            yield array(typecode, row)
+
+    @staticmethod
+    def _whole_number(cell: Any) -> int:
+        """
+        Returns the cell as an int if it holds a
+        whole number.
+        ----------------------------------------
+        -> Params
+            cell: Any → 3.0
+        """
+        if isinstance(cell, int):
+            return cell
+        if not isinstance(cell, float):
+            raise TypeError(f"Cell value {cell!r} is not a number.")
+        if not cell.is_integer():
+            raise ValueError(f"Cell value {cell!r} is not a whole number.")
+        return int(cell)
+
+    def fetch_all_numpy(self,
+                        dtype: Any = object,
+                        rows_count: int = None,
+                        columns_count: int = None) -> Any:
+        """
+        Fetch all data in the sheet as a numpy array
+        with the shape of (rows_count, columns_count).
+        ----------------------------------------------
+        -> Params
+            dtype: numpy dtype → object, numpy.float64
+            rows_count : int
+            columns_count: int
+        <- Return
+            numpy.ndarray
+        @note
+            Requires numpy. For sheets which only hold
+            numbers pass dtype=numpy.float64 so the
+            cells are converted in numpy's C code.
+            An empty sheet gives the shape (0, 0).
+        """
+        import numpy
+        data = tuple(self.fetch_all(rows_count, columns_count))
+        if not data:
+            return numpy.empty((0, 0), dtype=dtype)
+        return numpy.array(data, dtype=dtype)
+
+    def fetch_all_records(self) -> Any:
+        """
+        Fetch all data in the sheet as a numpy record
+        array, using the first row as field names, so
+        columns are read as records.header or
+        records["header"] without a dict per row.
+        ----------------------------------------------
+        <- Return
+            numpy.recarray
+        @note
+            Requires numpy. Headers must be unique and
+            not empty.
+        """
+        import numpy
+        values = self.used_range_tuple()[4]
+        if not values:
+            return numpy.recarray((0,), dtype=[])
+        dtype = numpy.dtype([(str(header), object) for header in values[0]])
+        records = numpy.array(list(values[1:]), dtype=dtype)
+        return records.view(numpy.recarray)
+
+    def apply(self,
+              kernel_fn: Callable,
+              start: tuple = (1, 1)) -> Any:
+        """
+        Fetch the sheet from start to its last cell
+        as one float64 numpy array and pass it to
+        kernel_fn, e.g. the numba kernels in kernels.
+        ---------------------------------------------
+        -> Params
+            kernel_fn: Callable → kernel_fn(numpy.ndarray)
+            start: tuple → (2, 1) to skip a header row
+        <- Return
+            whatever kernel_fn returns
+        @note
+            Requires numpy. Every cell in the range
+            must hold a number.
+        """
+        import numpy
+        end = (self.get_rows_count(), self.get_columns_count())
+        if end[0] < start[0] or end[1] < start[1]:
+            data = numpy.empty((0, 0))
+        else:
+            data = numpy.array(tuple(self.fetch_range(start, end)),
+                               dtype=numpy.float64)
+        return kernel_fn(data)
 
     def get_as_dict(self, 
                     headers: tuple,
@@ -218,8 +612,149 @@ class ExcelHandler:
         """
         Returns the data as a dicts
         """
-        for row in data:
-            yield dict(zip(headers, row))
+        yield from map(self._dict_builder(headers), data)
+
+    def fetch_all_as_dicts(self) -> Generator:
+        """
+        Fetch all data in the sheet as dicts, using
+        the first row as the headers. The sheet is
+        read with one COM call.
+        ------------------------------------------
+        <- Return
+            Generator
+        """
+        rows = iter(self.used_range_tuple()[4])
+        headers = next(rows, None)
+        if headers is None:
+            return
+        yield from map(self._dict_builder(headers), rows)
+
+    @classmethod
+    def _dict_builder(cls, headers: tuple) -> Callable:
+        """
+        Build a function which turns a row into a dict
+        with a literal made for the given headers, so
+        no zip or dict resizing happens per row. Rows
+        of another length fall back to dict(zip()).
+        ----------------------------------------------
+        -> Params
+            headers: tuple
+        <- Return
+            Callable
+        @note
+            From DICT_LITERAL_MAX_HEADERS headers on the
+            literal is slower than dict(zip()), so wide
+            sheets use dict(zip()) directly.
+        """
+        headers = tuple(headers)
+        if len(headers) >= cls.DICT_LITERAL_MAX_HEADERS:
+            return lambda row: dict(zip(headers, row))
+        namespace = {f"h{index}": header
+                     for index, header in enumerate(headers)}
+        namespace["headers"] = headers
+        items = ", ".join(f"h{index}: row[{index}]"
+                          for index in range(len(headers)))
+        source = (f"def make(row):\n"
+                  f"    if len(row) != {len(headers)}:\n"
+                  f"        return dict(zip(headers, row))\n"
+                  f"    return {{{items}}}\n")
+        exec(source, namespace)
+        return namespace["make"]
+
+    def get_as_namedtuple(self,
+                          headers: tuple,
+                          data: Generator) -> Generator:
+        """
+        Returns the data as namedtuples. They are
+        built faster and take less memory than dicts.
+        ---------------------------------------------
+        -> Params
+            headers: tuple
+            data: Generator
+        @note
+            Headers which are not valid identifiers
+            are renamed to _0, _1, ... by position.
+        """
+        row_type = namedtuple("Row",
+                              [str(header) for header in headers],
+                              rename=True)
+        yield from map(row_type._make, data)
+
+    def export_csv(self, file_path: str) -> None:
+        """
+        Export the active sheet to a csv file.
+        --------------------------------------
+        -> Params
+            file_path: str → absolute path
+        @note
+            The sheet is copied to a temporary work
+            book which is saved as csv and closed, so
+            the current work book keeps its own path
+            and format.
+            The file is written as UTF-8 with a BOM
+            (xlCSVUTF8, Excel 2016 and later), so text
+            outside the system code page is kept.
+        """
+        app = self.excel_app
+        self.sheet.Copy()
+        csv_book = app.ActiveWorkbook
+        display_alerts = app.DisplayAlerts
+        app.DisplayAlerts = False
+        try:
+            csv_book.SaveAs(file_path, FileFormat=self.XL_CSV_UTF8)
+        finally:
+            csv_book.Close(SaveChanges=False)
+            app.DisplayAlerts = display_alerts
+
+    def fetch_all_csv(self) -> Generator:
+        """
+        Fetch all data of the active sheet by exporting
+        it to a temporary csv file and reading it back.
+        This skips marshalling the cells through COM.
+        -----------------------------------------------
+        <- Return
+            Generator
+        @note
+            All the values are returned as strings,
+            formatted the way Excel displays them.
+        """
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, "sheet.csv")
+            self.export_csv(file_path)
+            with open(file_path, newline="", encoding="utf-8-sig") as csv_file:
+                yield from csv.reader(csv_file)
+
+    @staticmethod
+    def fetch_all_openpyxl(file_path: str,
+                           sheet_name: str = None) -> Generator:
+        """
+        Fetch all data of a xlsx file with openpyxl in
+        read only mode, without starting Excel at all.
+        ----------------------------------------------
+        -> Params
+            file_path: str
+            sheet_name: str
+        <- Return
+            Generator
+        @note
+            Requires openpyxl and only supports the
+            xlsx family. Formulas are returned as
+            their last calculated values.
+        """
+        from openpyxl import load_workbook
+        if not exists(file_path):
+            raise NotFoundExcelFileError("Couldn't find the desired excel file.")
+        work_book = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if not sheet_name:
+                sheet = work_book.worksheets[0]
+            elif sheet_name in work_book.sheetnames:
+                sheet = work_book[sheet_name]
+            else:
+                raise NotFoundSheetError("Desired sheet is not in the file.")
+            yield from sheet.iter_rows(values_only=True)
+        finally:
+            work_book.close()
 
     def update_cell(self,
                     cell_position: tuple,
@@ -232,7 +767,74 @@ class ExcelHandler:
             cell_positions: tuple → (5, 6)
             value: anything → int, float, datetime, string
         """
-        self.sheet.Cells(*cell_position).value = value
+        self.update_range(cell_position, ((value,),))
+
+    def update_range(self,
+                     start: tuple,
+                     values: tuple) -> None:
+        """
+        Update a block of cells in the active sheet
+        starting from the given position with one
+        COM call. The end cell is computed from the
+        shape of the values.
+        ------------------------------------------
+        -> Params
+            start: tuple → (5, 6)
+            values: tuple → ((1, "a"), (2, "b"))
+        @note
+            values must be rectangular. Tuples of
+            tuples are marshalled faster than lists.
+            An empty block writes nothing.
+        """
+        if not values or not values[0]:
+            return
+        self._invalidate_bounds()
+        rows_count = len(values)
+        columns_count = len(values[0])
+        end = (start[0] + rows_count - 1, start[1] + columns_count - 1)
+        cells = self.sheet.Cells
+        range_object = self.sheet.Range(cells(*start), cells(*end))
+        range_object.Value = tuple(tuple(row) for row in values)
+
+    @contextmanager
+    def fast_mode(self) -> Generator:
+        """
+        Turn off screen updating, automatic calculation
+        and events while the block runs and restore the
+        previous settings afterwards, even on errors.
+        ------------------------------------------------
+        @note
+            Wrap bulk reads and writes with it:
+            with handler.fast_mode():
+                handler.update_range((1, 1), values)
+            Excel only exposes the calculation mode
+            while a work book is open, so it is left
+            untouched if the block starts without one.
+        """
+        app = self.excel_app
+        screen_updating = app.ScreenUpdating
+        enable_events = app.EnableEvents
+        interrupt_key = app.CalculationInterruptKey
+        try:
+            calculation = app.Calculation
+        except com_error:
+            calculation = None
+        try:
+            app.ScreenUpdating = False
+            if calculation is not None:
+                app.Calculation = self.XL_CALCULATION_MANUAL
+            app.EnableEvents = False
+            app.CalculationInterruptKey = self.XL_NO_KEY
+            yield self
+        finally:
+            app.ScreenUpdating = screen_updating
+            if calculation is not None:
+                try:
+                    app.Calculation = calculation
+                except com_error:
+                    pass
+            app.EnableEvents = enable_events
+            app.CalculationInterruptKey = interrupt_key
 
     def save(self) -> None:
         """
@@ -246,13 +848,22 @@ class ExcelHandler:
         """
         self.work_book.SaveAs(file_path)
 
-    def close(self)-> None:
+    def close(self, save_changes: bool = None)-> None:
         """
-        Close the app
+        Close the work book of this handler. The
+        Excel application stays open for the other
+        handlers, use quit_app to close it.
+        ------------------------------------------
+        -> Params
+            save_changes: bool → None asks the user
         """
-        if self.excel_app.ActiveWorkbook:
-            self.excel_app.ActiveWorkbook.Close()
-        del self.excel_app
+        if self.work_book is None:
+            return
+        if save_changes is None:
+            self.work_book.Close()
+        else:
+            self.work_book.Close(SaveChanges=save_changes)
+        self.work_book = None
 
 
 
@@ -263,5 +874,7 @@ if __name__ == "__main__":
     with ExcelHandler() as handler:
         handler: ExcelHandler
         handler.open_excel(f"{getcwd()}/data/sample-1.xls")
-        data = list(handler.fetch_all())
-        pprint(data)
\ No newline at end of file
+        with handler.fast_mode():
+            data = list(handler.fetch_all())
+        pprint(data)
+    ExcelHandler.quit_app()
\ No newline at end of file
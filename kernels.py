@@ -0,0 +1,29 @@
+"""
+Contains numba kernels for the numeric data of the excel_handler.
+Pass them to ExcelHandler.apply. They are only worth it for large
+sheets which hold numbers only.
+"""
+
+import numpy
+from numba import njit
+from numba import prange
+
+
+@njit(parallel=True)
+def column_sum(data: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the sum of every column. The rows are
+    split between parallel threads, each one adds
+    whole rows, which are contiguous in memory, to
+    its own partial sums, and numba combines them.
+    --------------------------------------------
+    -> Params
+        data: numpy.ndarray → (rows_count, columns_count)
+    <- Return
+        numpy.ndarray → (columns_count,)
+    """
+    rows_count, columns_count = data.shape
+    totals = numpy.zeros(columns_count)
+    for row in prange(rows_count):
+        totals += data[row]
+    return totals